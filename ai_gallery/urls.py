@@ -15,19 +15,35 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from functools import lru_cache
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="AI Gallery API",
-        default_version="v1",
-        description="""
+
+# How long generated swagger/redoc pages are cached (seconds)
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+
+
+@lru_cache(maxsize=None)
+def get_docs_schema_view():
+    """
+    Build the drf-yasg schema view on first use.
+
+    Deferring the construction keeps the Info parsing and schema-view
+    class setup off the import path of every management command and
+    worker boot; processes that never serve the docs never pay for it.
+    """
+    from rest_framework import permissions
+    from drf_yasg.views import get_schema_view
+    from drf_yasg import openapi
+
+    return get_schema_view(
+        openapi.Info(
+            title="AI Gallery API",
+            default_version="v1",
+            description="""
 # AI Gallery API 문서
 
 AI Gallery는 사용자가 이미지를 업로드하고 AI를 활용하여 다양한 효과를 적용할 수 있는 소셜 미디어 플랫폼입니다.
@@ -57,14 +73,40 @@ Authorization: Bearer {access_token}
 
 ## 파일 업로드
 이미지 업로드는 `multipart/form-data` 형식을 사용합니다.
-        """,
-        terms_of_service="https://wookingwoo.com",
-        contact=openapi.Contact(email="contact@wookingwoo.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+            """,
+            terms_of_service="https://wookingwoo.com",
+            contact=openapi.Contact(email="contact@wookingwoo.com"),
+            license=openapi.License(name="BSD License"),
+        ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+@lru_cache(maxsize=None)
+def _docs_view(variant):
+    """Return (and memoize) the actual view callable for a docs variant."""
+    schema_view = get_docs_schema_view()
+    if variant == "json":
+        return schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT)
+    return schema_view.with_ui(
+        variant,
+        cache_timeout=SCHEMA_CACHE_TIMEOUT,
+        cache_kwargs={"key_prefix": "swagger"},
+    )
+
+
+def _schema_json(request, *args, **kwargs):
+    return _docs_view("json")(request, *args, **kwargs)
+
+
+def _swagger_ui(request, *args, **kwargs):
+    return _docs_view("swagger")(request, *args, **kwargs)
+
+
+def _redoc_ui(request, *args, **kwargs):
+    return _docs_view("redoc")(request, *args, **kwargs)
+
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -72,12 +114,15 @@ urlpatterns = [
     path("api/gallery/", include("gallery.urls")),
     path("api/ai/", include("ai_image_converter.urls")),
     # Swagger documentation
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
+    # The schema is public, so a single cached copy can serve every user.
+    # Regenerating it on each request re-introspects every view/serializer.
+    re_path(
+        r"^swagger(?P<format>\.json|\.yaml)$",
+        _schema_json,
+        name="schema-json",
     ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path("swagger/", _swagger_ui, name="schema-swagger-ui"),
+    path("redoc/", _redoc_ui, name="schema-redoc"),
 ]
 
 # Add static and media URLs in development
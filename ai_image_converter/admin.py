@@ -1,10 +1,32 @@
 from django.contrib import admin
-from .models import AIImage
+from .models import AIImage, MODEL_CHOICES
+
+
+class ModelUsedListFilter(admin.SimpleListFilter):
+    """
+    model_used filter with a fixed lookup list.
+
+    The field has no choices, so the stock filter would run a DISTINCT
+    query over the whole table on every changelist load just to build the
+    sidebar; the set of models we call is known up front.
+    """
+
+    title = "model used"
+    parameter_name = "model_used"
+
+    def lookups(self, request, model_admin):
+        return MODEL_CHOICES
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(model_used=self.value())
+        return queryset
 
 
 @admin.register(AIImage)
 class AIImageAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "model_used", "status", "created_at")
-    list_filter = ("status", "model_used", "created_at")
+    list_select_related = ("user",)
+    list_filter = ("status", ModelUsedListFilter, "created_at")
     search_fields = ("user__username", "prompt", "error_message")
     readonly_fields = ("created_at", "updated_at", "error_message")
@@ -1,5 +1,10 @@
+import logging
+import os
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class AiImageConverterConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
@@ -8,5 +13,35 @@ class AiImageConverterConfig(AppConfig):
 
     def ready(self):
         """Initialize app when Django starts"""
-        # Import signals or perform initialization tasks here
-        pass
+        # Pre-build the swagger schema once at boot so the first request to
+        # the docs serves a file read instead of paying the full generation
+        # cost. Opt-in so management commands and tests stay fast.
+        if os.environ.get("PREWARM_SWAGGER") == "1":
+            self._warm_swagger_schema()
+
+    @staticmethod
+    def _warm_swagger_schema():
+        """Render the swagger JSON once and store it under MEDIA_ROOT.
+
+        In development the file is directly reachable as /media/swagger.json;
+        in production a web server or CDN can serve it without touching
+        Django. The file is rewritten on every boot, so it never goes stale
+        across deploys.
+        """
+        from django.conf import settings
+        from django.test import RequestFactory
+
+        try:
+            from ai_gallery.urls import get_docs_schema_view
+
+            view = get_docs_schema_view().without_ui(cache_timeout=0)
+            request = RequestFactory().get("/swagger.json", HTTP_HOST="localhost")
+            response = view(request, format=".json")
+            response.render()
+
+            os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
+            cache_path = os.path.join(settings.MEDIA_ROOT, "swagger.json")
+            with open(cache_path, "wb") as f:
+                f.write(response.content)
+        except Exception:
+            logger.warning("Failed to pre-warm the swagger schema", exc_info=True)
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-09-01 08:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_image_converter', '0001_initial_squashed_0004_aiimage_error_message'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='aiimage',
+            name='error_message',
+            field=models.TextField(blank=True, help_text='ai 이미지 생성 실패 시 에러 메시지', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='aiimage',
+            index=models.Index(fields=['user', '-created_at'], name='aiimg_user_ctime'),
+        ),
+        migrations.AddIndex(
+            model_name='aiimage',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'failed'])), fields=['status'], name='aiimg_pending_partial'),
+        ),
+    ]
@@ -1,14 +1,34 @@
 from django.db import models
 from django.conf import settings
-import os
 import uuid
 
 
 def get_image_upload_path(instance, filename):
     """Generate a unique file path for the uploaded image"""
-    ext = filename.split(".")[-1]
-    filename = f"{uuid.uuid4()}.{ext}"
-    return os.path.join("ai_images", filename)
+    # rpartition avoids the list allocation of split(); guard against
+    # pathological extensions since the name ends up on disk.
+    ext = filename.rpartition(".")[2].lower()
+    if not ext.isalnum() or len(ext) > 10:
+        ext = "bin"
+    return f"ai_images/{uuid.uuid4().hex}.{ext}"
+
+
+# Module-level constants so the model, serializers and admin share one
+# tuple instead of re-declaring the choice lists inline.
+STATUS_CHOICES = (
+    ("pending", "Pending"),
+    ("processing", "Processing"),
+    ("completed", "Completed"),
+    ("failed", "Failed"),
+)
+
+MODEL_CHOICES = (
+    ("gpt-image-1", "gpt-image-1"),
+    ("default_model", "default_model"),
+    ("anime_style", "anime_style"),
+    ("pixel_art", "pixel_art"),
+    ("cartoon_realistic", "cartoon_realistic"),
+)
 
 
 class AIImage(models.Model):
@@ -53,12 +73,7 @@ class AIImage(models.Model):
     )
     status = models.CharField(
         max_length=20,
-        choices=[
-            ("pending", "Pending"),
-            ("processing", "Processing"),
-            ("completed", "Completed"),
-            ("failed", "Failed"),
-        ],
+        choices=STATUS_CHOICES,
         default="pending",
         help_text="현재 변환 상태 (pending: 대기 중, processing: 처리 중, completed: 완료, failed: 실패)",
     )
@@ -76,5 +91,18 @@ class AIImage(models.Model):
         help_text="마지막으로 변환 상태가 업데이트된 시간",
     )
 
+    class Meta:
+        indexes = [
+            # Covers the per-user list query (filter + -created_at ordering)
+            models.Index(fields=["user", "-created_at"], name="aiimg_user_ctime"),
+            # Partial index keeps the scheduler's pending/failed scan
+            # proportional to the backlog, not the whole table
+            models.Index(
+                fields=["status"],
+                condition=models.Q(status__in=["pending", "failed"]),
+                name="aiimg_pending_partial",
+            ),
+        ]
+
     def __str__(self):
         return f"AI image {self.id} by {self.user.username}"
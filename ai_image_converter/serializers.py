@@ -1,11 +1,14 @@
 from rest_framework import serializers
-from .models import AIImage
+from .models import AIImage, MODEL_CHOICES
 
 
 class AIImageSerializer(serializers.ModelSerializer):
     """Serializer for AI image conversions"""
 
-    user = serializers.SerializerMethodField()
+    # Direct source instead of a SerializerMethodField: no per-row method
+    # call, and the custom User model has no username — email is the
+    # login identifier (same representation the gallery serializers use).
+    user = serializers.ReadOnlyField(source="user.email")
 
     class Meta:
         model = AIImage
@@ -32,14 +35,14 @@ class AIImageSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
-    def get_user(self, obj):
-        """Return username as user representation"""
-        return obj.user.username
-
-
 class AIImageCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating AI image conversions"""
 
+    # Explicit ChoiceField over the shared constant: the choices mapping is
+    # built once here instead of per-request, and unknown model names are
+    # rejected at validation time.
+    model_used = serializers.ChoiceField(choices=MODEL_CHOICES, required=False)
+
     class Meta:
         model = AIImage
         fields = ["original_image", "prompt", "model_used"]
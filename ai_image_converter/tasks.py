@@ -0,0 +1,27 @@
+import logging
+
+from .models import AIImage
+from .utils import convert_to_ai_image
+
+logger = logging.getLogger(__name__)
+
+
+def convert_to_ai_image_task(image_id):
+    """
+    Run the AI conversion for a single image, loaded fresh by primary key.
+
+    This is the background entry point used by the worker pool. It takes
+    only a serializable id — never a live model instance — so the worker
+    always re-reads the committed row, and the call sites stay unchanged
+    if dispatch is later moved to an external queue (Celery/RQ).
+
+    Returns:
+        bool: True if conversion was successful, False otherwise
+    """
+    try:
+        image = AIImage.objects.get(pk=image_id)
+    except AIImage.DoesNotExist:
+        logger.warning("AIImage %s no longer exists; skipping conversion", image_id)
+        return False
+
+    return convert_to_ai_image(image)
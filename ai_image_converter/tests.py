@@ -1,3 +1,72 @@
-from django.test import TestCase
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from users.models import CreditUsage, User
+from .models import AIImage
 
 # Create your tests here.
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+@pytest.mark.django_db
+class TestAIImageAPI:
+    def test_regenerate(self, api_client):
+        user = User.objects.create_user(
+            email='ai@example.com', password='testpassword123'
+        )
+        image = AIImage.objects.create(
+            user=user,
+            original_image='ai_images/original.jpg',
+            status='completed',
+        )
+
+        api_client.force_authenticate(user=user)
+        url = reverse('ai-images-regenerate', args=[image.pk])
+        response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        user.refresh_from_db()
+        assert user.credits == 9
+
+    def test_regenerate_without_credits(self, api_client):
+        user = User.objects.create_user(
+            email='broke@example.com', password='testpassword123'
+        )
+        image = AIImage.objects.create(
+            user=user,
+            original_image='ai_images/original.jpg',
+            status='completed',
+        )
+        # Drain the balance behind the instance's back, the way a stale
+        # auth-cached request.user would see it
+        User.objects.filter(pk=user.pk).update(credits=0)
+
+        api_client.force_authenticate(user=user)
+        url = reverse('ai-images-regenerate', args=[image.pk])
+        response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['current_credits'] == 0
+        assert not CreditUsage.objects.filter(user=user).exists()
+
+    def test_regenerate_other_users_image(self, api_client):
+        owner = User.objects.create_user(
+            email='owner@example.com', password='testpassword123'
+        )
+        other = User.objects.create_user(
+            email='other@example.com', password='testpassword123'
+        )
+        image = AIImage.objects.create(
+            user=owner,
+            original_image='ai_images/original.jpg',
+            status='completed',
+        )
+
+        api_client.force_authenticate(user=other)
+        url = reverse('ai-images-regenerate', args=[image.pk])
+        response = api_client.post(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
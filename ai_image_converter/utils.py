@@ -1,12 +1,25 @@
 import os
 from django.core.files.base import ContentFile
+from functools import lru_cache
 import logging
-import base64
+import binascii
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_openai_client():
+    """
+    Return the shared OpenAI client.
+
+    Built lazily because the API key comes from the environment, and reused
+    so concurrent conversions share the underlying httpx connection pool
+    (which is thread-safe) instead of paying a TCP/TLS handshake per call.
+    """
+    return OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+
 def convert_to_ai_image(image_instance):
     """
     Convert an image using OpenAI's image editing API.
@@ -18,33 +31,35 @@ def convert_to_ai_image(image_instance):
         bool: True if conversion was successful, False otherwise
     """
     try:
-        # Update status to processing
+        # Flag the row as processing with a single UPDATE. Going through the
+        # queryset skips model signals and the auto_now touch; the instance
+        # attribute is kept in sync for the final save below.
         image_instance.status = "processing"
-        image_instance.save(update_fields=["status"])
-
-        # Get original image path
-        original_image_path = image_instance.original_image.path
+        type(image_instance).objects.filter(pk=image_instance.pk).update(
+            status="processing"
+        )
 
-        # Get API key from environment variables
-        api_key = os.environ.get("OPENAI_API_KEY")
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
 
         # Get the prompt from the image instance
         ghibli_prompt = "Turn this photo into studio ghibli style art with vibrant colors, dream-like landscapes and that signature Miyazaki charm."
         prompt = image_instance.prompt or ghibli_prompt
 
-        # Call OpenAI API to convert the image
-        result = client.images.edit(
-            model="gpt-image-1",
-            image=[
-                open(original_image_path, "rb"),
-            ],
-            prompt=prompt,
-        )
-
-        # Get the base64 image data and decode it
+        # Call OpenAI API to convert the image. Opening through the storage
+        # backend streams the bytes regardless of where the file lives
+        # (local disk, S3, ...) and always closes the handle.
+        with image_instance.original_image.open("rb") as original_file:
+            result = client.images.edit(
+                model="gpt-image-1",
+                image=[original_file],
+                prompt=prompt,
+            )
+
+        # Get the base64 image data and decode it. binascii.a2b_base64 is
+        # the C primitive base64.b64decode wraps, minus the extra
+        # validation pass — worthwhile for multi-megabyte payloads.
         image_base64 = result.data[0].b64_json
-        image_bytes = base64.b64decode(image_base64)
+        image_bytes = binascii.a2b_base64(image_base64.encode("ascii"))
 
         # Create a unique filename for the converted image
         filename = os.path.basename(image_instance.original_image.name)
@@ -65,9 +80,11 @@ def convert_to_ai_image(image_instance):
         error_message = str(e)
         logger.error(f"Error converting image: {error_message}")
 
-        # Save error message to database
+        # Save error message to database in one UPDATE
         image_instance.status = "failed"
         image_instance.error_message = error_message
-        image_instance.save(update_fields=["status", "error_message"])
+        type(image_instance).objects.filter(pk=image_instance.pk).update(
+            status="failed", error_message=error_message
+        )
 
         return False
@@ -1,18 +1,98 @@
 from django.shortcuts import render
-from rest_framework import viewsets, status, parsers, mixins
+from rest_framework import viewsets, status, parsers, mixins, pagination
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from .models import AIImage
 from .serializers import AIImageSerializer, AIImageCreateSerializer
-from .utils import convert_to_ai_image
+from .tasks import convert_to_ai_image_task
+from django.db import transaction
 from django.db.models import Q
-import threading
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 
+User = get_user_model()
+
+# Bounded worker pool for AI conversions. A raw thread per request means
+# unbounded OS threads (each with its own stack) all blocked on the OpenAI
+# round-trip under burst traffic; a fixed pool gives back-pressure instead.
+_AI_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("AI_WORKERS", 8)),
+    thread_name_prefix="ai-convert",
+)
+atexit.register(_AI_EXECUTOR.shutdown, wait=False)
+
+# Swagger pieces shared by several actions, built once at import instead
+# of once per decorator site.
+_RESP_404_NOT_FOUND = openapi.Response(
+    description="존재하지 않는 이미지",
+    examples={"application/json": {"detail": "찾을 수 없습니다."}},
+)
+_NO_CREDITS_EXAMPLE = {
+    "application/json": {
+        "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
+        "current_credits": 0,
+    }
+}
+_LIST_EXAMPLE = {
+    "application/json": [
+        {
+            "id": 1,
+            "user": "username",
+            "original_image": "/media/ai_images/original.jpg",
+            "converted_image": "/media/ai_images/original_ai.jpg",
+            "prompt": "만화 스타일로 변환해주세요",
+            "model_used": "anime_style",
+            "status": "completed",
+            "created_at": "2023-06-15T10:30:00Z",
+            "updated_at": "2023-06-15T10:35:00Z",
+        }
+    ]
+}
+_CREATE_EXAMPLE = {
+    "application/json": {
+        "id": 1,
+        "user": "username",
+        "original_image": "/media/ai_images/original.jpg",
+        "converted_image": None,
+        "prompt": "애니메이션 캐릭터처럼 만들어주세요",
+        "model_used": "anime_style",
+        "status": "pending",
+        "created_at": "2023-06-15T10:30:00Z",
+        "updated_at": "2023-06-15T10:30:00Z",
+    }
+}
+_RETRIEVE_EXAMPLE = {
+    "application/json": {
+        "id": 1,
+        "user": "username",
+        "original_image": "/media/ai_images/original.jpg",
+        "converted_image": "/media/ai_images/original_ai.jpg",
+        "prompt": "애니메이션 캐릭터처럼 만들어주세요",
+        "model_used": "anime_style",
+        "status": "completed",
+        "created_at": "2023-06-15T10:30:00Z",
+        "updated_at": "2023-06-15T10:35:00Z",
+    }
+}
+
+
+class AIImageCursorPagination(pagination.CursorPagination):
+    """Cursor pagination for the AI image list, newest first."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    # id breaks ties between equal timestamps (bulk creates, backfills);
+    # without it the cursor can skip or repeat rows across pages
+    ordering = ("-created_at", "-id")
+
 
 class AIImageViewSet(
     mixins.CreateModelMixin,
@@ -32,10 +112,29 @@ class AIImageViewSet(
 
     permission_classes = [IsAuthenticated]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
+    pagination_class = AIImageCursorPagination
 
     def get_queryset(self):
         """Return images created by the current user"""
-        return AIImage.objects.filter(user=self.request.user).order_by("-created_at")
+        # Load only the columns the serializer renders, so the result set
+        # stays bounded by page_size rather than the user's full history.
+        return (
+            AIImage.objects.select_related("user")
+            .filter(user=self.request.user)
+            .only(
+                "id",
+                "original_image",
+                "converted_image",
+                "prompt",
+                "model_used",
+                "status",
+                "error_message",
+                "created_at",
+                "updated_at",
+                "user__email",
+            )
+            .order_by("-created_at")
+        )
 
     def get_serializer_class(self):
         """Return appropriate serializer class"""
@@ -54,21 +153,7 @@ class AIImageViewSet(
             200: openapi.Response(
                 description="변환된 이미지 목록이 성공적으로 반환되었습니다",
                 schema=AIImageSerializer(many=True),
-                examples={
-                    "application/json": [
-                        {
-                            "id": 1,
-                            "user": "username",
-                            "original_image": "/media/ai_images/original.jpg",
-                            "converted_image": "/media/ai_images/original_ai.jpg",
-                            "prompt": "만화 스타일로 변환해주세요",
-                            "model_used": "anime_style",
-                            "status": "completed",
-                            "created_at": "2023-06-15T10:30:00Z",
-                            "updated_at": "2023-06-15T10:35:00Z",
-                        }
-                    ]
-                },
+                examples=_LIST_EXAMPLE,
             ),
             401: openapi.Response(
                 description="인증되지 않은 사용자",
@@ -126,53 +211,39 @@ class AIImageViewSet(
             201: openapi.Response(
                 description="이미지가 성공적으로 업로드되고 변환이 시작되었습니다",
                 schema=AIImageSerializer,
-                examples={
-                    "application/json": {
-                        "id": 1,
-                        "user": "username",
-                        "original_image": "/media/ai_images/original.jpg",
-                        "converted_image": None,
-                        "prompt": "애니메이션 캐릭터처럼 만들어주세요",
-                        "model_used": "anime_style",
-                        "status": "pending",
-                        "created_at": "2023-06-15T10:30:00Z",
-                        "updated_at": "2023-06-15T10:30:00Z",
-                    }
-                },
+                examples=_CREATE_EXAMPLE,
             ),
             400: openapi.Response(
                 description="잘못된 요청 또는 크레딧 부족",
-                examples={
-                    "application/json": {
-                        "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
-                        "current_credits": 0,
-                    }
-                },
+                examples=_NO_CREDITS_EXAMPLE,
             ),
             401: "인증되지 않은 사용자",
         },
         tags=["ai 이미지 변환"],
     )
     def create(self, request, *args, **kwargs):
-        # 사용자 크레딧 확인
-        user = request.user
-        if user.credits < 1:
-            return Response(
-                {
-                    "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
-                    "current_credits": user.credits,
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # 크레딧을 차감하고 이미지 변환 처리 진행
         create_serializer = self.get_serializer(data=request.data)
         create_serializer.is_valid(raise_exception=True)
-        instance = self.perform_create(create_serializer)
-        headers = self.get_success_headers(create_serializer.data)
 
-        # 크레딧 사용
-        user.use_credit(amount=1, reason="AI 이미지 변환")
+        # 크레딧 확인/차감과 이미지 생성을 한 트랜잭션으로 묶고 사용자
+        # 행을 잠가서 동시 요청이 크레딧을 이중 차감하지 못하게 한다
+        with transaction.atomic():
+            user = User.objects.select_for_update().get(pk=request.user.pk)
+            if user.credits < 1:
+                return Response(
+                    {
+                        "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
+                        "current_credits": user.credits,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            instance = self.perform_create(create_serializer)
+
+            # 크레딧 사용
+            user.use_credit(amount=1, reason="AI 이미지 변환")
+
+        headers = self.get_success_headers(create_serializer.data)
 
         # 전체 필드를 포함한 응답 생성
         response_serializer = AIImageSerializer(instance)
@@ -185,9 +256,11 @@ class AIImageViewSet(
         """Save the user and start the conversion process"""
         instance = serializer.save(user=self.request.user)
 
-        # Start conversion in background thread to avoid blocking the response
-        thread = threading.Thread(target=convert_to_ai_image, args=(instance,))
-        thread.start()
+        # Queue conversion only once the transaction commits, so the worker
+        # never races a row (or credit deduction) that may still roll back
+        transaction.on_commit(
+            lambda: _AI_EXECUTOR.submit(convert_to_ai_image_task, instance.pk)
+        )
 
         return instance
 
@@ -202,24 +275,9 @@ class AIImageViewSet(
             200: openapi.Response(
                 description="이미지 세부 정보 조회 성공",
                 schema=AIImageSerializer(),
-                examples={
-                    "application/json": {
-                        "id": 1,
-                        "user": "username",
-                        "original_image": "/media/ai_images/original.jpg",
-                        "converted_image": "/media/ai_images/original_ai.jpg",
-                        "prompt": "애니메이션 캐릭터처럼 만들어주세요",
-                        "model_used": "anime_style",
-                        "status": "completed",
-                        "created_at": "2023-06-15T10:30:00Z",
-                        "updated_at": "2023-06-15T10:35:00Z",
-                    }
-                },
-            ),
-            404: openapi.Response(
-                description="존재하지 않는 이미지",
-                examples={"application/json": {"detail": "찾을 수 없습니다."}},
+                examples=_RETRIEVE_EXAMPLE,
             ),
+            404: _RESP_404_NOT_FOUND,
             401: "인증되지 않은 사용자",
         },
         tags=["ai 이미지 변환"],
@@ -236,10 +294,7 @@ class AIImageViewSet(
         """,
         responses={
             204: openapi.Response(description="이미지가 성공적으로 삭제되었습니다"),
-            404: openapi.Response(
-                description="존재하지 않는 이미지",
-                examples={"application/json": {"detail": "찾을 수 없습니다."}},
-            ),
+            404: _RESP_404_NOT_FOUND,
             401: "인증되지 않은 사용자",
         },
         tags=["ai 이미지 변환"],
@@ -274,17 +329,9 @@ class AIImageViewSet(
             ),
             400: openapi.Response(
                 description="크레딧 부족",
-                examples={
-                    "application/json": {
-                        "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
-                        "current_credits": 0,
-                    }
-                },
-            ),
-            404: openapi.Response(
-                description="존재하지 않는 이미지",
-                examples={"application/json": {"detail": "찾을 수 없습니다."}},
+                examples=_NO_CREDITS_EXAMPLE,
             ),
+            404: _RESP_404_NOT_FOUND,
             401: "인증되지 않은 사용자",
         },
         tags=["ai 이미지 변환"],
@@ -294,35 +341,57 @@ class AIImageViewSet(
         """Regenerate the AI image"""
         user = request.user
 
-        # 크레딧 확인
-        if user.credits < 1:
-            return Response(
-                {
-                    "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
-                    "current_credits": user.credits,
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        image = get_object_or_404(AIImage, id=pk, user=user)
+        # Only the pk is needed to queue the job, so look the row up lean
+        # instead of through get_queryset() (whose select_related("user")
+        # cannot be combined with deferring the user column); the user
+        # filter stays so other users' images still 404
+        image = get_object_or_404(
+            AIImage.objects.only("id", "status"), pk=pk, user=user
+        )
 
-        # 크레딧 사용
-        user.use_credit(amount=1, reason="AI 이미지 재변환")
+        with transaction.atomic():
+            # use_credit's conditional UPDATE is the authoritative balance
+            # check — request.user can carry a stale credits value (auth
+            # cache), so nothing is queued unless the deduction landed
+            if not user.use_credit(amount=1, reason="AI 이미지 재변환"):
+                user.refresh_from_db(fields=["credits"])
+                return Response(
+                    {
+                        "error": "크레딧이 부족합니다. 크레딧을 충전하신 후 다시 시도해주세요.",
+                        "current_credits": user.credits,
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        # Start conversion in background thread
-        thread = threading.Thread(target=convert_to_ai_image, args=(image,))
-        thread.start()
+            # Queue conversion only once the deduction commits; if the
+            # transaction rolls back the conversion is never started
+            transaction.on_commit(
+                lambda: _AI_EXECUTOR.submit(convert_to_ai_image_task, image.pk)
+            )
 
         return Response(
             {"status": "conversion started"}, status=status.HTTP_202_ACCEPTED
         )
 
 
-def process_pending_images():
+def process_pending_images(batch_size=500):
     """Process any pending images - can be called by a scheduled task"""
-    pending_images = AIImage.objects.filter(Q(status="pending") | Q(status="failed"))
+    with transaction.atomic():
+        ids = list(
+            AIImage.objects.filter(Q(status="pending") | Q(status="failed"))
+            .values_list("id", flat=True)
+            .order_by("created_at")[:batch_size]
+        )
+        if not ids:
+            return
+
+        # Claim the whole batch in one UPDATE so concurrent scheduler runs
+        # do not double-process the same rows; the rest of the backlog is
+        # picked up by the next run.
+        AIImage.objects.filter(
+            id__in=ids, status__in=["pending", "failed"]
+        ).update(status="processing")
 
-    for image in pending_images:
-        # Start conversion in background thread
-        thread = threading.Thread(target=convert_to_ai_image, args=(image,))
-        thread.start()
+    for image_id in ids:
+        # Queue conversion on the worker pool
+        _AI_EXECUTOR.submit(convert_to_ai_image_task, image_id)
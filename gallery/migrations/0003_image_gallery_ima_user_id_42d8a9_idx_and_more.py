@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-09-01 08:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(fields=['user', '-created_at'], name='gallery_ima_user_id_42d8a9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(fields=['visibility', '-created_at'], name='gallery_ima_visibil_6c85bc_idx'),
+        ),
+    ]
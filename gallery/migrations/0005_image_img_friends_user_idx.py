@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-09-01 09:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gallery', '0004_alter_like_unique_together_like_uniq_like_image_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(condition=models.Q(('visibility', 'friends')), fields=['user'], name='img_friends_user_idx'),
+        ),
+    ]
@@ -1,6 +1,24 @@
 from django.db import models
 from django.conf import settings
 
+from users.models import Friendship
+
+
+class ImageQuerySet(models.QuerySet):
+    """Queryset with the gallery's shared visibility rules."""
+
+    def visible_to(self, user):
+        """
+        Images ``user`` may see: public ones, their own, and friends-only
+        images from users they are friends with.
+        """
+        friend_ids = Friendship.objects.filter(user=user).values("friend_id")
+        return self.filter(
+            models.Q(visibility="public")
+            | models.Q(user=user)
+            | models.Q(user_id__in=friend_ids, visibility="friends")
+        )
+
 
 class Image(models.Model):
     """Model for user uploaded images."""
@@ -17,12 +35,27 @@ class Image(models.Model):
     visibility = models.CharField(max_length=10, choices=VISIBILITY_CHOICES, default='public')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    objects = ImageQuerySet.as_manager()
+
     def __str__(self):
         return self.title
-    
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # my_images: filter by owner, newest first
+            models.Index(fields=['user', '-created_at']),
+            # public/friend feeds: filter by visibility, newest first
+            models.Index(fields=['visibility', '-created_at']),
+            # friends-only branch of the visibility filter: small partial
+            # index on the owner for user_id IN (...) AND visibility='friends'
+            models.Index(
+                fields=['user'],
+                condition=models.Q(visibility='friends'),
+                name='img_friends_user_idx',
+            ),
+        ]
 
 
 class Comment(models.Model):
@@ -48,7 +81,11 @@ class Like(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        unique_together = ('image', 'user')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['image', 'user'], name='uniq_like_image_user'
+            ),
+        ]
     
     def __str__(self):
         return f"Like by {self.user.email} on {self.image.title}"
@@ -9,15 +9,12 @@ class CommentSerializer(serializers.ModelSerializer):
     """Serializer for image comments."""
     
     user_email = serializers.ReadOnlyField(source='user.email')
-    user_name = serializers.SerializerMethodField()
-    
+    user_name = serializers.CharField(source='user.full_name', read_only=True)
+
     class Meta:
         model = Comment
         fields = ('id', 'image', 'user', 'user_email', 'user_name', 'text', 'created_at')
         read_only_fields = ('user', 'created_at')
-    
-    def get_user_name(self, obj):
-        return f"{obj.user.first_name} {obj.user.last_name}"
 
 
 class LikeSerializer(serializers.ModelSerializer):
@@ -35,24 +32,44 @@ class ImageSerializer(serializers.ModelSerializer):
     """Serializer for user images."""
     
     user_email = serializers.ReadOnlyField(source='user.email')
-    user_name = serializers.SerializerMethodField()
+    user_name = serializers.CharField(source='user.full_name', read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
     likes_count = serializers.SerializerMethodField()
+    comments_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
-    
+
     class Meta:
         model = Image
-        fields = ('id', 'user', 'user_email', 'user_name', 'image', 'title', 'description', 
-                  'visibility', 'created_at', 'updated_at', 'comments', 'likes_count', 'is_liked')
+        fields = ('id', 'user', 'user_email', 'user_name', 'image', 'title', 'description',
+                  'visibility', 'created_at', 'updated_at', 'comments', 'likes_count',
+                  'comments_count', 'is_liked')
         read_only_fields = ('user', 'created_at', 'updated_at')
-    
-    def get_user_name(self, obj):
-        return f"{obj.user.first_name} {obj.user.last_name}"
-    
+
     def get_likes_count(self, obj):
+        # Populated by the viewset's annotate(); the fallback covers callers
+        # that serialize an image outside an annotated queryset.
+        count = getattr(obj, 'likes_count', None)
+        if count is not None:
+            return count
         return obj.likes.count()
-    
+
+    def get_comments_count(self, obj):
+        # Populated by the viewset's annotate(); the fallback reuses the
+        # prefetched comments rather than issuing a COUNT query.
+        count = getattr(obj, 'comments_count', None)
+        if count is not None:
+            return count
+        return len(obj.comments.all())
+
     def get_is_liked(self, obj):
+        # Annotated by the viewset via Exists(); the fallbacks cover
+        # callers serializing outside the annotated queryset.
+        annotated = getattr(obj, 'is_liked', None)
+        if annotated is not None:
+            return bool(annotated)
+        liked_ids = self.context.get('liked_ids')
+        if liked_ids is not None:
+            return obj.id in liked_ids
         request = self.context.get('request')
         if request and hasattr(request, 'user') and request.user.is_authenticated:
             return obj.likes.filter(user=request.user).exists()
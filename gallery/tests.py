@@ -124,14 +124,14 @@ class TestImageAPI:
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        assert len(response.data['results']) == 3
         
         # User 1 should see friend images
         url = reverse('image-friend-images')
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
         
         # User 2 should not see User 1's friends-only images since no friendship in that direction
         api_client.force_authenticate(user=user2)
@@ -139,7 +139,7 @@ class TestImageAPI:
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0
+        assert len(response.data['results']) == 0
 
 @pytest.mark.django_db
 class TestCommentAPI:
@@ -191,9 +191,10 @@ class TestLikeAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert Like.objects.filter(user=user, image=image).exists()
         
-        # Try to like again - should fail
+        # Liking again is idempotent - returns the existing like
         response = api_client.post(url, data, format='json')
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.status_code == status.HTTP_200_OK
+        assert Like.objects.filter(user=user, image=image).count() == 1
         
         # Unlike the image
         url = reverse('like-unlike')
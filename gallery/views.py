@@ -2,7 +2,8 @@ from django.shortcuts import render
 from rest_framework import viewsets, status, permissions, parsers, pagination
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch
 from .models import Image, Comment, Like
 from .serializers import ImageSerializer, CommentSerializer, LikeSerializer
 from users.models import Friendship
@@ -10,6 +11,37 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 
+def _friend_ids(request):
+    """Memoized ids of users who list the requester as a friend.
+
+    Cached on the request so repeated per-object permission checks cost
+    at most one friendship query per request.
+    """
+    ids = getattr(request, "_friend_ids", None)
+    if ids is None:
+        ids = set(
+            Friendship.objects.filter(friend=request.user).values_list(
+                "user_id", flat=True
+            )
+        )
+        request._friend_ids = ids
+    return ids
+
+
+def _comments_with_authors():
+    """Prefetch queryset for nested comments, authors joined and trimmed."""
+    return Comment.objects.select_related("user").only(
+        "id",
+        "image_id",
+        "text",
+        "created_at",
+        "user__id",
+        "user__email",
+        "user__first_name",
+        "user__last_name",
+    )
+
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     """
     Custom permission to only allow owners of an object to edit it.
@@ -31,29 +63,48 @@ class VisibilityPermission(permissions.BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        # Owner can always access their own images
-        if obj.user == request.user:
+        # Owner can always access their own images; compare ids so a
+        # narrowed (.only) image row does not lazy-load the user FK
+        if obj.user_id == request.user.id:
             return True
 
         # For public images, anyone can access
         if obj.visibility == "public":
             return True
 
-        # For friends-only images, check if the user is a friend
+        # For friends-only images, check if the user is a friend; prefer
+        # the _friend_visible annotation from ImageViewSet.get_queryset so
+        # a page of images does not fire one EXISTS query per row
         if obj.visibility == "friends":
-            return Friendship.objects.filter(
-                user=obj.user, friend=request.user
-            ).exists()
+            friend_visible = getattr(obj, "_friend_visible", None)
+            if friend_visible is not None:
+                return bool(friend_visible)
+            # Fallback costs one friendship query per request, not per object
+            return obj.user_id in _friend_ids(request)
 
         return False
 
 
-class CustomPagination(pagination.PageNumberPagination):
-    """Custom pagination class for images."""
+class CountlessPagination(pagination.CursorPagination):
+    """
+    Cursor pagination for the gallery feed.
+
+    Skips the COUNT(*) that PageNumberPagination runs on every page just
+    to report a total, so page cost stays flat as the feed grows.
+    """
 
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+    # The pk tiebreaker keeps the keyset stable when several rows share
+    # a created_at timestamp (bulk imports, tests)
+    ordering = ("-created_at", "-id")
+
+
+class CommentPagination(CountlessPagination):
+    """Comments read oldest-first, matching the model ordering."""
+
+    ordering = ("created_at", "id")
 
 
 class ImageViewSet(viewsets.ModelViewSet):
@@ -66,7 +117,7 @@ class ImageViewSet(viewsets.ModelViewSet):
         VisibilityPermission,
     ]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser]
-    pagination_class = CustomPagination
+    pagination_class = CountlessPagination
 
     def get_queryset(self):
         """
@@ -77,20 +128,44 @@ class ImageViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
 
-        # Get IDs of all friends
-        friend_ids = Friendship.objects.filter(user=user).values_list(
-            "friend_id", flat=True
-        )
-
-        # Return all images that are:
-        # 1. Public
-        # 2. User's own images
-        # 3. Friend's images with "friends-only" visibility
-        return Image.objects.filter(
-            Q(visibility="public")
-            | Q(user=user)
-            | Q(user_id__in=friend_ids, visibility="friends")
+        # visible_to covers the public/own/friends-only filter with the
+        # friend ids as a subquery; likes_count/is_liked are annotated here
+        # so the serializer does not run a COUNT or EXISTS per rendered row.
+        queryset = (
+            Image.objects.visible_to(user)
+            .select_related("user")
+            .only(
+                "id",
+                "image",
+                "title",
+                "description",
+                "visibility",
+                "created_at",
+                "updated_at",
+                "user__id",
+                "user__email",
+                "user__first_name",
+                "user__last_name",
+            )
+            .prefetch_related(
+                Prefetch("comments", queryset=_comments_with_authors())
+            )
+            .annotate(
+                likes_count=Count("likes", distinct=True),
+                comments_count=Count("comments", distinct=True),
+            )
         )
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                is_liked=Exists(Like.objects.filter(image=OuterRef("pk"), user=user)),
+                # Read by VisibilityPermission instead of a per-object query
+                _friend_visible=Exists(
+                    Friendship.objects.filter(
+                        user_id=OuterRef("user_id"), friend=user
+                    )
+                ),
+            )
+        return queryset
 
     @swagger_auto_schema(
         operation_description="이미지를 업로드하고 생성합니다.",
@@ -163,7 +238,9 @@ class ImageViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def my_images(self, request):
         """Retrieve only the authenticated user's images."""
-        images = Image.objects.filter(user=request.user)
+        # get_queryset() always includes the user's own images, so narrowing
+        # it keeps the joins, projection and count annotations in one place
+        images = self.get_queryset().filter(user=request.user)
         page = self.paginate_queryset(images)
         if page is not None:
             serializer = self.get_serializer(
@@ -198,15 +275,13 @@ class ImageViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def friend_images(self, request):
         """Retrieve images from friends."""
-        # Get IDs of all friends
-        friend_ids = Friendship.objects.filter(user=request.user).values_list(
-            "friend_id", flat=True
-        )
+        # Kept as a subquery (not materialized into a list) so the DB can
+        # flatten it into a semi-join against the image indexes
+        friend_ids = Friendship.objects.filter(user=request.user).values("friend_id")
 
-        # Get all images from friends that the user is allowed to see
-        images = Image.objects.filter(user_id__in=friend_ids).filter(
-            Q(visibility="public") | Q(visibility="friends")
-        )
+        # get_queryset() already limits friends' images to what the user may
+        # see, so narrowing to friend owners reuses its joins and annotations
+        images = self.get_queryset().filter(user_id__in=friend_ids)
 
         page = self.paginate_queryset(images)
         if page is not None:
@@ -249,29 +324,23 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
-    pagination_class = CustomPagination
+    pagination_class = CommentPagination
 
     def get_queryset(self):
         """Return comments for images the user can see."""
-        return Comment.objects.filter(image__in=self.get_visible_images())
+        return Comment.objects.filter(
+            image__in=self.get_visible_images()
+        ).select_related("user")
 
     def get_visible_images(self):
         """Get all images the user can see."""
-        user = self.request.user
-        friend_ids = Friendship.objects.filter(user=user).values_list(
-            "friend_id", flat=True
-        )
-
-        return Image.objects.filter(
-            Q(visibility="public")
-            | Q(user=user)
-            | Q(user_id__in=friend_ids, visibility="friends")
-        )
+        return Image.objects.visible_to(self.request.user)
 
     def perform_create(self, serializer):
         """Set the user when creating a comment."""
         image_id = self.request.data.get("image")
-        image = Image.objects.get(id=image_id)
+        # The visibility check only reads owner id and visibility
+        image = Image.objects.only("id", "user_id", "visibility").get(id=image_id)
 
         # Check if user has permission to comment (can see the image)
         if not VisibilityPermission().has_object_permission(self.request, self, image):
@@ -312,24 +381,15 @@ class LikeViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "post", "delete"]  # patch 메서드 사용 안함
     serializer_class = LikeSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = CustomPagination
+    pagination_class = CountlessPagination
 
     def get_queryset(self):
         """Return likes for the user."""
-        return Like.objects.filter(user=self.request.user)
+        return Like.objects.filter(user=self.request.user).select_related("user")
 
     def get_visible_images(self):
         """Get all images the user can see."""
-        user = self.request.user
-        friend_ids = Friendship.objects.filter(user=user).values_list(
-            "friend_id", flat=True
-        )
-
-        return Image.objects.filter(
-            Q(visibility="public")
-            | Q(user=user)
-            | Q(user_id__in=friend_ids, visibility="friends")
-        )
+        return Image.objects.visible_to(self.request.user)
 
     @swagger_auto_schema(
         operation_description="사용자의 좋아요 목록을 조회합니다.",
@@ -357,7 +417,8 @@ class LikeViewSet(viewsets.ModelViewSet):
     def create(self, request, *args, **kwargs):
         """Create a like if it doesn't exist already."""
         image_id = request.data.get("image")
-        image = Image.objects.get(id=image_id)
+        # The visibility check only reads owner id and visibility
+        image = Image.objects.only("id", "user_id", "visibility").get(id=image_id)
 
         # Check if user can see the image
         if not VisibilityPermission().has_object_permission(request, self, image):
@@ -366,19 +427,18 @@ class LikeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Check if like already exists
-        if Like.objects.filter(user=request.user, image_id=image_id).exists():
-            return Response(
-                {"detail": "You have already liked this image."},
-                status=status.HTTP_400_BAD_REQUEST,
+        # get_or_create leans on the unique constraint instead of a
+        # separate EXISTS pre-check, so duplicates (including concurrent
+        # ones) are idempotent: 201 on first like, 200 after that.
+        with transaction.atomic():
+            like, created = Like.objects.get_or_create(
+                user=request.user, image=image
             )
-
-        # Create the like
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save(user=request.user)
-
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        serializer = self.get_serializer(like)
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
 
     @swagger_auto_schema(
         operation_description="이미지에 대한 좋아요를 취소합니다. (image id 기반)",
@@ -406,12 +466,15 @@ class LikeViewSet(viewsets.ModelViewSet):
                 {"detail": "Image ID is required."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        like = Like.objects.filter(user=request.user, image_id=image_id).first()
-        if not like:
+        # One DELETE; the rowcount tells us whether a like existed, so
+        # there is no SELECT-then-delete round-trip
+        deleted, _ = Like.objects.filter(
+            user=request.user, image_id=image_id
+        ).delete()
+        if not deleted:
             return Response(
                 {"detail": "You have not liked this image."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        like.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
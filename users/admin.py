@@ -50,6 +50,10 @@ class CreditUsageAdmin(admin.ModelAdmin):
     list_filter = ("is_usage", "created_at")
     search_fields = ("user__email", "reason")
     date_hierarchy = "created_at"
+    list_select_related = ("user",)
+    # The ledger grows by one row per credit change; skip the unfiltered
+    # COUNT(*) the changelist runs just to show "N total"
+    show_full_result_count = False
 
 
 class FriendshipAdmin(admin.ModelAdmin):
@@ -57,6 +61,7 @@ class FriendshipAdmin(admin.ModelAdmin):
 
     list_display = ("user", "friend", "created_at")
     search_fields = ("user__email", "friend__email")
+    list_select_related = ("user", "friend")
 
 
 class FriendRequestAdmin(admin.ModelAdmin):
@@ -65,6 +70,7 @@ class FriendRequestAdmin(admin.ModelAdmin):
     list_display = ("sender", "receiver", "status", "created_at", "updated_at")
     list_filter = ("status",)
     search_fields = ("sender__email", "receiver__email")
+    list_select_related = ("sender", "receiver")
 
 
 admin.site.register(User, UserAdmin)
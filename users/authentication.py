@@ -0,0 +1,70 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+# Short TTL: a stale is_active/permission change is corrected within a
+# minute, while every authenticated request in between skips the user
+# SELECT entirely
+JWT_USER_CACHE_TIMEOUT = 60
+
+# Tokens whose signature already checked out are trusted for at most
+# this long (never past their own exp)
+JWT_TOKEN_CACHE_TIMEOUT = 60
+
+
+def jwt_user_cache_key(user_id):
+    return f"jwt:user:{user_id}"
+
+
+def _jwt_token_cache_key(raw_token):
+    # The raw token is credential material; store only a digest of it
+    digest = hashlib.blake2b(raw_token, digest_size=16).hexdigest()
+    return f"jwt:tok:{digest}"
+
+
+class CachingJWTAuthentication(JWTAuthentication):
+    """JWT authentication that caches the resolved user briefly.
+
+    Stock JWTAuthentication runs ``User.objects.get(pk=...)`` on every
+    request just to turn the token's user_id claim into a row. The user
+    is cached per id; password change and deactivation drop the entry.
+
+    Signature verification is cached the same way: once a token has
+    been fully validated, its digest is remembered and later requests
+    with the same token skip the HMAC check for up to a minute.
+    """
+
+    def get_validated_token(self, raw_token):
+        key = _jwt_token_cache_key(raw_token)
+        if cache.get(key):
+            # Seen and verified recently; decode without re-checking the
+            # signature. Fall through to full validation if decoding
+            # fails anyway (e.g. cache collision).
+            for auth_token_class in api_settings.AUTH_TOKEN_CLASSES:
+                try:
+                    return auth_token_class(raw_token, verify=False)
+                except TokenError:
+                    continue
+
+        validated_token = super().get_validated_token(raw_token)
+
+        timeout = JWT_TOKEN_CACHE_TIMEOUT
+        exp = validated_token.get("exp")
+        if exp is not None:
+            timeout = min(timeout, int(exp - time.time()))
+        if timeout > 0:
+            cache.set(key, True, timeout)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        key = jwt_user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, JWT_USER_CACHE_TIMEOUT)
+        return user
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-09-01 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_alter_friendship_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='creditusage',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='users_credi_user_id_cbb4cb_idx'),
+        ),
+    ]
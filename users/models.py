@@ -1,8 +1,21 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+# 크레딧 잔액은 클라이언트가 자주 폴링하므로 짧게 캐시하고, 잔액이
+# 변동될 때마다 삭제해 read-your-writes를 보장합니다.
+CREDITS_CACHE_TIMEOUT = 5
+
+
+def credits_cache_key(user_id):
+    """Cache key for a user's current credit balance."""
+    return f"credits:{user_id}"
+
+
 class UserManager(BaseUserManager):
     """Define a model manager for User model with no username field."""
 
@@ -55,9 +68,21 @@ class User(AbstractUser):
 
     objects = UserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Backs case-insensitive lookups (email__iexact) for emails
+            # that were stored before normalization
+            models.Index(Lower("email"), name="user_email_lower_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
+    @cached_property
+    def full_name(self):
+        """Display name rendered by the gallery serializers."""
+        return f"{self.first_name} {self.last_name}"
+
     def use_credit(self, amount=1, reason="AI 이미지 변환"):
         """
         사용자의 크레딧을 사용합니다.
@@ -72,17 +97,55 @@ class User(AbstractUser):
         Raises:
             ValueError: 크레딧이 부족한 경우
         """
-        if self.credits < amount:
+        # 잔액 확인과 차감을 DB에서 한 문장으로 처리해 동시 요청 간의
+        # lost update를 방지합니다.
+        updated = type(self).objects.filter(
+            pk=self.pk, credits__gte=amount
+        ).update(credits=models.F("credits") - amount)
+        if not updated:
             return False
 
-        self.credits -= amount
-        self.save(update_fields=["credits"])
+        self.refresh_from_db(fields=["credits"])
+        cache.delete(credits_cache_key(self.pk))
 
         # 크레딧 사용 내역 기록
         CreditUsage.objects.create(user=self, amount=amount, reason=reason)
 
         return True
 
+    def use_credits_bulk(self, charges):
+        """
+        여러 건의 크레딧 사용을 한 번에 처리합니다.
+
+        잔액 차감은 합계로 UPDATE 한 번, 내역 기록은 bulk_create 한 번으로
+        처리되어 건수와 무관하게 2개의 쿼리만 실행됩니다.
+
+        Args:
+            charges (list[tuple[int, str]]): (사용량, 이유) 목록
+
+        Returns:
+            bool: 크레딧 사용 성공 여부 (잔액 부족 시 False, 차감 없음)
+        """
+        total = sum(amount for amount, _ in charges)
+        if not total:
+            return True
+
+        updated = type(self).objects.filter(
+            pk=self.pk, credits__gte=total
+        ).update(credits=models.F("credits") - total)
+        if not updated:
+            return False
+
+        self.refresh_from_db(fields=["credits"])
+        cache.delete(credits_cache_key(self.pk))
+
+        CreditUsage.objects.bulk_create(
+            CreditUsage(user=self, amount=amount, reason=reason)
+            for amount, reason in charges
+        )
+
+        return True
+
     def add_credits(self, amount, reason="크레딧 충전"):
         """
         사용자에게 크레딧을 추가합니다.
@@ -91,8 +154,11 @@ class User(AbstractUser):
             amount (int): 추가할 크레딧 양
             reason (str): 크레딧 추가 이유
         """
-        self.credits += amount
-        self.save(update_fields=["credits"])
+        type(self).objects.filter(pk=self.pk).update(
+            credits=models.F("credits") + amount
+        )
+        self.refresh_from_db(fields=["credits"])
+        cache.delete(credits_cache_key(self.pk))
 
         # 크레딧 추가 내역 기록
         CreditUsage.objects.create(
@@ -110,7 +176,11 @@ class Friendship(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ("user", "friend")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "friend"], name="uniq_user_friend"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} is friends with {self.friend.email}"
@@ -143,12 +213,23 @@ class FriendRequest(models.Model):
 
     def accept(self):
         """Accept friend request and create friendship."""
-        if self.status == "pending":
-            # Create bi-directional friendship
-            Friendship.objects.create(user=self.sender, friend=self.receiver)
-            Friendship.objects.create(user=self.receiver, friend=self.sender)
+        if self.status != "pending":
+            return
+        with transaction.atomic():
+            # One INSERT for both directions; ignore_conflicts turns a
+            # repeated accept into a no-op instead of an IntegrityError
+            Friendship.objects.bulk_create(
+                [
+                    Friendship(user=self.sender, friend=self.receiver),
+                    Friendship(user=self.receiver, friend=self.sender),
+                ],
+                ignore_conflicts=True,
+            )
+            updated = FriendRequest.objects.filter(
+                pk=self.pk, status="pending"
+            ).update(status="accepted")
+        if updated:
             self.status = "accepted"
-            self.save()
 
     def reject(self):
         """Reject friend request."""
@@ -180,3 +261,7 @@ class CreditUsage(models.Model):
         ordering = ["-created_at"]
         verbose_name = "크레딧 사용 내역"
         verbose_name_plural = "크레딧 사용 내역"
+        indexes = [
+            # Backs the per-user ledger listing and its keyset cursor
+            models.Index(fields=["user", "-created_at", "-id"]),
+        ]
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
 from django.contrib.auth.password_validation import validate_password
 from .models import Friendship, FriendRequest, User, CreditUsage
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
@@ -50,22 +51,17 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "credits"]
 
     def create(self, validated_data):
-        user = User.objects.create_user(
+        # The optional fields go through create_user so registration is a
+        # single INSERT instead of INSERT + UPDATE
+        return User.objects.create_user(
             email=validated_data["email"],
             first_name=validated_data["first_name"],
             last_name=validated_data["last_name"],
             password=validated_data["password"],
+            profile_image=validated_data.get("profile_image"),
+            bio=validated_data.get("bio", ""),
         )
 
-        if "profile_image" in validated_data:
-            user.profile_image = validated_data["profile_image"]
-
-        if "bio" in validated_data:
-            user.bio = validated_data["bio"]
-
-        user.save()
-        return user
-
     def update(self, instance, validated_data):
         if "password" in validated_data:
             password = validated_data.pop("password")
@@ -95,11 +91,27 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = ("id", "email", "first_name", "last_name", "profile_image", "bio")
         read_only_fields = ("email",)
 
+    def update(self, instance, validated_data):
+        # UPDATE only the submitted columns instead of rewriting the row
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
+        return instance
+
+
+class NestedUserSerializer(serializers.ModelSerializer):
+    """Slim user representation for nesting inside list responses."""
+
+    class Meta:
+        model = User
+        fields = ("id", "email", "first_name", "last_name", "profile_image")
+
 
 class FriendshipSerializer(serializers.ModelSerializer):
     """Serializer for friendships."""
 
-    friend = UserSerializer(read_only=True)
+    friend = NestedUserSerializer(read_only=True)
 
     class Meta:
         model = Friendship
@@ -110,8 +122,8 @@ class FriendshipSerializer(serializers.ModelSerializer):
 class FriendRequestSerializer(serializers.ModelSerializer):
     """Serializer for friend requests."""
 
-    sender = UserSerializer(read_only=True)
-    receiver = UserSerializer(read_only=True)
+    sender = NestedUserSerializer(read_only=True)
+    receiver = NestedUserSerializer(read_only=True)
     receiver_email = serializers.EmailField(write_only=True)
 
     class Meta:
@@ -132,7 +144,18 @@ class FriendRequestSerializer(serializers.ModelSerializer):
         receiver_email = validated_data.pop("receiver_email")
 
         try:
-            receiver = User.objects.get(email=receiver_email)
+            # Both existence checks ride along as EXISTS subqueries on the
+            # receiver lookup, so validation costs one query instead of three
+            receiver = User.objects.annotate(
+                has_pending_request=Exists(
+                    FriendRequest.objects.filter(
+                        sender=sender, receiver=OuterRef("pk"), status="pending"
+                    )
+                ),
+                is_friend=Exists(
+                    Friendship.objects.filter(user=sender, friend=OuterRef("pk"))
+                ),
+            ).get(email__iexact=receiver_email)
         except User.DoesNotExist:
             raise serializers.ValidationError(
                 {"receiver_email": "해당 이메일을 가진 사용자가 존재하지 않습니다."}
@@ -143,14 +166,12 @@ class FriendRequestSerializer(serializers.ModelSerializer):
                 {"receiver_email": "자신에게 친구 요청을 보낼 수 없습니다."}
             )
 
-        if FriendRequest.objects.filter(
-            sender=sender, receiver=receiver, status="pending"
-        ).exists():
+        if receiver.has_pending_request:
             raise serializers.ValidationError(
                 {"receiver_email": "이미 해당 사용자에게 친구 요청을 보냈습니다."}
             )
 
-        if Friendship.objects.filter(user=sender, friend=receiver).exists():
+        if receiver.is_friend:
             raise serializers.ValidationError(
                 {"receiver_email": "이미 해당 사용자와 친구입니다."}
             )
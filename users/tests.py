@@ -1,5 +1,7 @@
 from django.test import TestCase
+from functools import lru_cache
 import pytest
+from django.contrib.auth.hashers import make_password
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.urls import reverse
@@ -7,6 +9,10 @@ from .models import User, Friendship
 
 # Create your tests here.
 
+# Password hashing dominates test-user creation time; hash each distinct
+# test password once per process instead of once per created user.
+_hash_password = lru_cache(maxsize=None)(make_password)
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -14,15 +20,30 @@ def api_client():
 @pytest.fixture
 def create_user():
     def _create_user(email='test@example.com', password='testpassword123', **kwargs):
-        return User.objects.create_user(
+        kwargs.setdefault('first_name', 'Test')
+        kwargs.setdefault('last_name', 'User')
+        return User.objects.create(
             email=email,
-            password=password,
-            first_name=kwargs.get('first_name', 'Test'),
-            last_name=kwargs.get('last_name', 'User'),
+            password=_hash_password(password),
             **kwargs
         )
     return _create_user
 
+@pytest.fixture
+def create_users():
+    """Create several users with one INSERT instead of one per user."""
+    def _create_users(*emails, password='testpassword123'):
+        return User.objects.bulk_create(
+            User(
+                email=email,
+                password=_hash_password(password),
+                first_name='Test',
+                last_name='User',
+            )
+            for email in emails
+        )
+    return _create_users
+
 @pytest.mark.django_db
 class TestUserModel:
     def test_create_user(self, create_user):
@@ -104,34 +125,44 @@ class TestFriendshipAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert Friendship.objects.filter(user=user1, friend=user2).exists()
     
-    def test_list_friendships(self, api_client, create_user):
-        user1 = create_user(email='user1@example.com')
-        user2 = create_user(email='user2@example.com')
-        user3 = create_user(email='user3@example.com')
-        
-        Friendship.objects.create(user=user1, friend=user2)
-        Friendship.objects.create(user=user1, friend=user3)
+    def test_list_friendships(self, api_client, create_users,
+                              django_assert_max_num_queries):
+        user1, user2, user3 = create_users(
+            'user1@example.com', 'user2@example.com', 'user3@example.com'
+        )
+
+        Friendship.objects.bulk_create([
+            Friendship(user=user1, friend=user2),
+            Friendship(user=user1, friend=user3),
+        ])
         
         api_client.force_authenticate(user=user1)
         url = reverse('friendship-list')
-        response = api_client.get(url)
-        
+        # select_related keeps the list at one query however many
+        # friends; cursor pagination adds no COUNT query
+        with django_assert_max_num_queries(2):
+            response = api_client.get(url)
+
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data['results']) == 2
     
-    def test_find_users(self, api_client, create_user):
-        user1 = create_user(email='user1@example.com')
-        user2 = create_user(email='user2@example.com')
-        user3 = create_user(email='friend@example.com')
+    def test_find_users(self, api_client, create_users,
+                        django_assert_max_num_queries):
+        user1, user2, user3 = create_users(
+            'user1@example.com', 'user2@example.com', 'friend@example.com'
+        )
         
         # Create friendship between user1 and user3
         Friendship.objects.create(user=user1, friend=user3)
         
         api_client.force_authenticate(user=user1)
         url = reverse('friendship-find-users')
-        response = api_client.get(url)
+        # One COUNT for the paginator plus one page query; the anti-join
+        # and slim serializer must not add per-row queries
+        with django_assert_max_num_queries(3):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         # Should only see user2, as user3 is already a friend
-        assert len(response.data) == 1
-        assert response.data[0]['email'] == 'user2@example.com'
+        assert len(response.data['results']) == 1
+        assert response.data['results'][0]['email'] == 'user2@example.com'
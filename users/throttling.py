@@ -0,0 +1,20 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class AuthRateThrottle(SimpleRateThrottle):
+    """
+    Per-IP throttle for the auth endpoints (register/login/refresh/logout).
+
+    These views are the cheapest abuse targets: each anonymous request
+    costs a password hash check or a DB write before any permission runs.
+    The bucket is keyed per endpoint so a login flood cannot exhaust the
+    register quota, and vice versa.
+    """
+
+    scope = "auth"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": f"{self.scope}:{view.__class__.__name__}",
+            "ident": self.get_ident(request),
+        }
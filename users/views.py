@@ -1,12 +1,24 @@
-from rest_framework import viewsets, status, generics
+import hashlib
+
+from rest_framework import viewsets, status, generics, pagination
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from .models import User, Friendship, FriendRequest, CreditUsage
+from .authentication import jwt_user_cache_key
+from .throttling import AuthRateThrottle
+from .models import (
+    CREDITS_CACHE_TIMEOUT,
+    CreditUsage,
+    FriendRequest,
+    Friendship,
+    User,
+    credits_cache_key,
+)
 from .serializers import (
     UserSerializer,
     UserProfileSerializer,
+    NestedUserSerializer,
     FriendshipSerializer,
     TokenObtainPairResponseSerializer,
     TokenRefreshResponseSerializer,
@@ -16,46 +28,112 @@ from .serializers import (
     CreditChargeSerializer,
     CustomTokenObtainPairSerializer,
 )
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework import parsers
 
+# Mobile clients poll /me frequently; the serialized profile is cached
+# per user and dropped whenever the profile is updated
+ME_CACHE_TIMEOUT = 5 * 60
+
+
+def _make_etag(*parts):
+    """Content-derived ETag; identical state always hashes identically."""
+    raw = ":".join(str(part) for part in parts).encode()
+    return '"%s"' % hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _me_cache_key(user):
+    return f"user:me:{user.pk}"
+
+
+# Request-body schemas are built once at import instead of inside each
+# decorator call site
+_REGISTER_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["email", "first_name", "last_name", "password"],
+    properties={
+        "email": openapi.Schema(
+            type=openapi.TYPE_STRING,
+            format=openapi.FORMAT_EMAIL,
+            description="사용자 이메일 주소 (로그인 ID로 사용됩니다)",
+        ),
+        "first_name": openapi.Schema(
+            type=openapi.TYPE_STRING, description="사용자 이름"
+        ),
+        "last_name": openapi.Schema(
+            type=openapi.TYPE_STRING, description="사용자 성"
+        ),
+        "password": openapi.Schema(
+            type=openapi.TYPE_STRING,
+            format=openapi.FORMAT_PASSWORD,
+            description="비밀번호 (보안 요구사항을 충족해야 합니다)",
+        ),
+        "profile_image": openapi.Schema(
+            type=openapi.TYPE_FILE,
+            description="프로필 이미지 (선택 사항)",
+            format="binary",
+        ),
+        "bio": openapi.Schema(
+            type=openapi.TYPE_STRING, description="자기소개 (선택 사항)"
+        ),
+    },
+)
+
+_ME_UPDATE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "first_name": openapi.Schema(type=openapi.TYPE_STRING),
+        "last_name": openapi.Schema(type=openapi.TYPE_STRING),
+        "profile_image": openapi.Schema(type=openapi.TYPE_FILE),
+        "bio": openapi.Schema(type=openapi.TYPE_STRING),
+    },
+)
+
+_CHANGE_PASSWORD_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["old_password", "new_password"],
+    properties={
+        "old_password": openapi.Schema(
+            type=openapi.TYPE_STRING, description="현재 비밀번호"
+        ),
+        "new_password": openapi.Schema(
+            type=openapi.TYPE_STRING, description="새 비밀번호"
+        ),
+    },
+)
+
+_FRIENDSHIP_CREATE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["friend"],
+    properties={
+        "friend": openapi.Schema(
+            type=openapi.TYPE_INTEGER,
+            description="ID of the user to add as a friend",
+        )
+    },
+)
+
+_FRIEND_REQUEST_CREATE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["receiver"],
+    properties={
+        "receiver": openapi.Schema(
+            type=openapi.TYPE_INTEGER,
+            description="ID of the user to send friend request to",
+        )
+    },
+)
+
 
 @swagger_auto_schema(
-    request_body=openapi.Schema(
-        type=openapi.TYPE_OBJECT,
-        required=["email", "first_name", "last_name", "password"],
-        properties={
-            "email": openapi.Schema(
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_EMAIL,
-                description="사용자 이메일 주소 (로그인 ID로 사용됩니다)",
-            ),
-            "first_name": openapi.Schema(
-                type=openapi.TYPE_STRING, description="사용자 이름"
-            ),
-            "last_name": openapi.Schema(
-                type=openapi.TYPE_STRING, description="사용자 성"
-            ),
-            "password": openapi.Schema(
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_PASSWORD,
-                description="비밀번호 (보안 요구사항을 충족해야 합니다)",
-            ),
-            "profile_image": openapi.Schema(
-                type=openapi.TYPE_FILE,
-                description="프로필 이미지 (선택 사항)",
-                format="binary",
-            ),
-            "bio": openapi.Schema(
-                type=openapi.TYPE_STRING, description="자기소개 (선택 사항)"
-            ),
-        },
-    ),
+    request_body=_REGISTER_SCHEMA,
     operation_description="""
     새로운 사용자 계정을 생성합니다.
     
@@ -90,6 +168,7 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     permission_classes = (AllowAny,)
     serializer_class = UserSerializer
+    throttle_classes = [AuthRateThrottle]
     parser_classes = [parsers.MultiPartParser, parsers.FormParser, parsers.JSONParser]
 
 
@@ -99,12 +178,13 @@ class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
 
+    # Both permission classes are stateless, so the instances can be
+    # shared across requests instead of re-allocated per call
+    _action_permissions = {"create": [AllowAny()]}
+    _default_permissions = [IsAuthenticated()]
+
     def get_permissions(self):
-        if self.action == "create":
-            permission_classes = [AllowAny]
-        else:
-            permission_classes = [IsAuthenticated]
-        return [permission() for permission in permission_classes]
+        return self._action_permissions.get(self.action, self._default_permissions)
 
     def get_serializer_class(self):
         if self.action in ["update", "partial_update", "me"]:
@@ -149,15 +229,7 @@ class UserViewSet(viewsets.ModelViewSet):
         - 비밀번호 변경은 별도의 change_password API를 사용해야 합니다.
         - 프로필 이미지는 multipart/form-data 형식으로 전송해야 합니다.
         """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                "first_name": openapi.Schema(type=openapi.TYPE_STRING),
-                "last_name": openapi.Schema(type=openapi.TYPE_STRING),
-                "profile_image": openapi.Schema(type=openapi.TYPE_FILE),
-                "bio": openapi.Schema(type=openapi.TYPE_STRING),
-            },
-        ),
+        request_body=_ME_UPDATE_SCHEMA,
         responses={200: UserProfileSerializer, 400: "Bad Request"},
     )
     @action(
@@ -169,12 +241,27 @@ class UserViewSet(viewsets.ModelViewSet):
         """Get or update current user's profile."""
         user = request.user
         if request.method == "GET":
-            serializer = self.get_serializer(user)
-            return Response(serializer.data)
+            key = _me_cache_key(user)
+            data = cache.get(key)
+            if data is None:
+                data = self.get_serializer(user).data
+                cache.set(key, data, ME_CACHE_TIMEOUT)
+            # Polling clients resend the last ETag; unchanged profiles
+            # get an empty 304 instead of the JSON body
+            etag = _make_etag(user.pk, data)
+            if request.headers.get("If-None-Match") == etag:
+                return Response(status=status.HTTP_304_NOT_MODIFIED)
+            response = Response(data)
+            response["ETag"] = etag
+            return response
 
         serializer = self.get_serializer(user, data=request.data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            cache.delete(_me_cache_key(user))
+            # The auth cache still holds the pre-update row; without this
+            # the next GET would serialize (and re-cache) stale data
+            cache.delete(jwt_user_cache_key(user.pk))
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -189,18 +276,7 @@ class UserViewSet(viewsets.ModelViewSet):
         - 새 비밀번호는 Django의 비밀번호 검증 규칙을 통과해야 합니다.
         - 비밀번호 변경 후 기존 토큰은 계속 유효합니다.
         """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=["old_password", "new_password"],
-            properties={
-                "old_password": openapi.Schema(
-                    type=openapi.TYPE_STRING, description="현재 비밀번호"
-                ),
-                "new_password": openapi.Schema(
-                    type=openapi.TYPE_STRING, description="새 비밀번호"
-                ),
-            },
-        ),
+        request_body=_CHANGE_PASSWORD_SCHEMA,
         responses={
             200: openapi.Response(
                 description="비밀번호가 성공적으로 변경됨",
@@ -226,7 +302,8 @@ class UserViewSet(viewsets.ModelViewSet):
 
         if serializer.is_valid():
             user.set_password(serializer.validated_data["new_password"])
-            user.save()
+            user.save(update_fields=["password"])
+            cache.delete(jwt_user_cache_key(user.pk))
             return Response(
                 {"detail": "Password changed successfully."}, status=status.HTTP_200_OK
             )
@@ -258,26 +335,153 @@ class UserViewSet(viewsets.ModelViewSet):
         """Deactivate user's account."""
         user = request.user
         user.is_active = False
-        user.save()
+        user.save(update_fields=["is_active"])
+        cache.delete(jwt_user_cache_key(user.pk))
         return Response(
             {"detail": "Account deactivated successfully."}, status=status.HTTP_200_OK
         )
 
 
+def _friend_requests_with_users():
+    """Base friend-request queryset, joined users trimmed to what is serialized."""
+    return FriendRequest.objects.select_related("sender", "receiver").only(
+        "id",
+        "status",
+        "created_at",
+        "updated_at",
+        "sender__id",
+        "sender__email",
+        "sender__first_name",
+        "sender__last_name",
+        "sender__profile_image",
+        "receiver__id",
+        "receiver__email",
+        "receiver__first_name",
+        "receiver__last_name",
+        "receiver__profile_image",
+    )
+
+
+class FindUsersPagination(pagination.PageNumberPagination):
+    """Bounds find_users responses; the user table grows without limit."""
+
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class FastCursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination for the friendship and friend-request lists.
+
+    Unlike PageNumberPagination this runs no COUNT(*) per request, which
+    dominates query time once those tables grow. `-id` matches insertion
+    order and needs no extra index.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-id"
+
+
+class CreditUsagePagination(pagination.CursorPagination):
+    """
+    Keyset pagination for the credit ledger.
+
+    The ledger grows by one row per credit change, so OFFSET pagination
+    (and its COUNT query) would degrade linearly with history depth.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+
 class FriendshipViewSet(viewsets.ModelViewSet):
     """ViewSet for friendship management."""
 
     serializer_class = FriendshipSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = FastCursorPagination
 
     def get_queryset(self):
         """Return friendships for the current user."""
-        return Friendship.objects.filter(user=self.request.user)
+        return (
+            Friendship.objects.filter(user=self.request.user)
+            .select_related("friend")
+            .only(
+                "id",
+                "created_at",
+                "friend__id",
+                "friend__email",
+                "friend__first_name",
+                "friend__last_name",
+                "friend__profile_image",
+            )
+        )
 
-    @swagger_auto_schema(auto_schema=None)
+    @swagger_auto_schema(
+        request_body=_FRIENDSHIP_CREATE_SCHEMA,
+        operation_description="다른 사용자와의 친구 관계를 생성합니다.",
+        responses={
+            201: openapi.Response(
+                description="친구 관계가 성공적으로 생성됨",
+                schema=FriendshipSerializer,
+            ),
+            400: openapi.Response(description="잘못된 요청"),
+            404: openapi.Response(description="사용자를 찾을 수 없음"),
+        },
+    )
     def create(self, request, *args, **kwargs):
-        """친구 관계 생성은 친구 요청 수락을 통해서만 가능하기 때문에 지원하지 않음"""
-        pass
+        """Create a friendship with another user."""
+        # DRF's Request resolves .user/.data through __getattr__; bind
+        # them once instead of re-resolving per use
+        user = request.user
+        friend_id = request.data.get("friend")
+        if not friend_id:
+            return Response(
+                {"detail": "Friend ID is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            friend_id = int(friend_id)
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        if friend_id == user.pk:
+            return Response(
+                {"detail": "Cannot create a friendship with yourself."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Single INSERT: the unique constraint rejects duplicates and the
+        # FK rejects unknown users, so no lookup or EXISTS pre-check runs
+        try:
+            with transaction.atomic():
+                friendship = Friendship.objects.create(
+                    user=user, friend_id=friend_id
+                )
+        except IntegrityError as exc:
+            # Postgres reports the violated constraint's name, sqlite the
+            # column list; anything that is not the duplicate case can
+            # only be the FK rejecting an unknown user
+            message = str(exc).lower()
+            if "uniq_user_friend" in message or "unique constraint" in message:
+                return Response(
+                    {"detail": "Friendship already exists."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(
+                {"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = self.get_serializer(friendship)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(auto_schema=None)
     def update(self, request, *args, **kwargs):
@@ -304,23 +508,26 @@ class FriendshipViewSet(viewsets.ModelViewSet):
         responses={
             200: openapi.Response(
                 description="List of users that are not friends",
-                schema=UserProfileSerializer(many=True),
+                schema=NestedUserSerializer(many=True),
             )
         },
     )
     @action(detail=False, methods=["get"])
     def find_users(self, request):
         """Find users that are not friends with the current user."""
+        user = request.user
         search_query = request.query_params.get("search", "")
 
-        # Get all friend IDs
-        friend_ids = Friendship.objects.filter(user=request.user).values_list(
-            "friend_id", flat=True
+        # Correlated NOT EXISTS instead of materializing the friend-id
+        # list in Python and shipping it back as an IN (...) clause; the
+        # (user, friend) unique index backs the anti-join
+        friend_subq = Friendship.objects.filter(user=user, friend=OuterRef("pk"))
+        users = (
+            User.objects.exclude(id=user.id)
+            .annotate(is_friend=Exists(friend_subq))
+            .filter(is_friend=False)
         )
 
-        # Find users that are not friends and match search query
-        users = User.objects.exclude(id=request.user.id).exclude(id__in=friend_ids)
-
         if search_query:
             users = users.filter(
                 Q(email__icontains=search_query)
@@ -328,13 +535,25 @@ class FriendshipViewSet(viewsets.ModelViewSet):
                 | Q(last_name__icontains=search_query)
             )
 
-        page = self.paginate_queryset(users)
-        if page is not None:
-            serializer = UserProfileSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = UserProfileSerializer(users, many=True)
-        return Response(serializer.data)
+        # values() hands back flat dicts, skipping model instantiation
+        # and per-row serializer Field binding for what is a plain
+        # five-column projection anyway
+        users = users.values(
+            "id", "email", "first_name", "last_name", "profile_image"
+        ).order_by("id")
+
+        paginator = FindUsersPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        # Only the image column needs post-processing: values() returns
+        # the stored file name, not a URL
+        for row in page:
+            name = row["profile_image"]
+            row["profile_image"] = (
+                request.build_absolute_uri(settings.MEDIA_URL + name)
+                if name
+                else None
+            )
+        return paginator.get_paginated_response(page)
 
 
 class FriendRequestViewSet(viewsets.ModelViewSet):
@@ -342,11 +561,15 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
 
     serializer_class = FriendRequestSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = FastCursorPagination
 
     def get_queryset(self):
         """Return friend requests for the current user."""
+        # Ordering comes from the cursor paginator
         user = self.request.user
-        return FriendRequest.objects.filter(Q(sender=user) | Q(receiver=user))
+        return _friend_requests_with_users().filter(
+            Q(sender=user) | Q(receiver=user)
+        )
 
     @swagger_auto_schema(auto_schema=None)
     def update(self, request, *args, **kwargs):
@@ -359,16 +582,7 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
         pass
 
     @swagger_auto_schema(
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=["receiver"],
-            properties={
-                "receiver": openapi.Schema(
-                    type=openapi.TYPE_INTEGER,
-                    description="ID of the user to send friend request to",
-                )
-            },
-        ),
+        request_body=_FRIEND_REQUEST_CREATE_SCHEMA,
         operation_description="""
         다른 사용자에게 친구 요청을 보냅니다.
         
@@ -397,52 +611,75 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
     )
     def create(self, request, *args, **kwargs):
         """Create a new friend request."""
-        receiver_id = request.data.get("receiver")
-        receiver = get_object_or_404(User, id=receiver_id)
+        try:
+            receiver_id = int(request.data.get("receiver"))
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND
+            )
 
         # Don't allow sending friend request to self
-        if receiver == request.user:
+        if receiver_id == request.user.id:
             return Response(
                 {"detail": "Cannot send friend request to yourself."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if friendship already exists
-        if Friendship.objects.filter(user=request.user, friend=receiver).exists():
+        # One probe answers both "does the receiver exist" and "are we
+        # already friends": the friendship check rides along on the pk
+        # lookup as an EXISTS subquery, so validation costs one query
+        is_friend = (
+            User.objects.filter(pk=receiver_id)
+            .annotate(
+                is_friend=Exists(
+                    Friendship.objects.filter(
+                        user=request.user, friend=OuterRef("pk")
+                    )
+                )
+            )
+            .values_list("is_friend", flat=True)
+            .first()
+        )
+        if is_friend is None:
             return Response(
-                {"detail": "Friendship already exists."},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND
             )
-
-        # Check if there's already a pending request
-        existing_request = FriendRequest.objects.filter(
-            sender=request.user, receiver=receiver, status="pending"
-        ).first()
-
-        if existing_request:
+        if is_friend:
             return Response(
-                {"detail": "Friend request already sent."},
+                {"detail": "Friendship already exists."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if there's a pending request from the receiver to the sender
-        reverse_request = FriendRequest.objects.filter(
-            sender=receiver, receiver=request.user, status="pending"
-        ).first()
+        with transaction.atomic():
+            # Fetch pending requests in both directions with one query;
+            # sender_id tells us which direction each row is
+            pending = FriendRequest.objects.filter(
+                Q(sender=request.user, receiver_id=receiver_id)
+                | Q(sender_id=receiver_id, receiver=request.user),
+                status="pending",
+            )[:2]
+            reverse_request = None
+            for friend_request in pending:
+                if friend_request.sender_id == request.user.id:
+                    return Response(
+                        {"detail": "Friend request already sent."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                reverse_request = friend_request
+
+            if reverse_request:
+                # Auto-accept the reverse request
+                reverse_request.accept()
+                return Response(
+                    {"detail": "Request from the user was automatically accepted."},
+                    status=status.HTTP_201_CREATED,
+                )
 
-        if reverse_request:
-            # Auto-accept the reverse request
-            reverse_request.accept()
-            return Response(
-                {"detail": "Request from the user was automatically accepted."},
-                status=status.HTTP_201_CREATED,
+            # Create new friend request
+            friend_request = FriendRequest.objects.create(
+                sender=request.user, receiver_id=receiver_id, status="pending"
             )
 
-        # Create new friend request
-        friend_request = FriendRequest.objects.create(
-            sender=request.user, receiver=receiver, status="pending"
-        )
-
         serializer = self.get_serializer(friend_request)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -567,7 +804,9 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def received(self, request):
         """List received friend requests."""
-        friend_requests = FriendRequest.objects.filter(receiver=request.user)
+        friend_requests = _friend_requests_with_users().filter(
+            receiver=request.user
+        )
 
         page = self.paginate_queryset(friend_requests)
         if page is not None:
@@ -597,7 +836,9 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def sent(self, request):
         """List sent friend requests."""
-        friend_requests = FriendRequest.objects.filter(sender=request.user)
+        friend_requests = _friend_requests_with_users().filter(
+            sender=request.user
+        )
 
         page = self.paginate_queryset(friend_requests)
         if page is not None:
@@ -610,6 +851,7 @@ class FriendRequestViewSet(viewsets.ModelViewSet):
 
 class DecoratedTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [AuthRateThrottle]
 
     @swagger_auto_schema(
         operation_description="""
@@ -630,6 +872,8 @@ class DecoratedTokenObtainPairView(TokenObtainPairView):
 
 
 class DecoratedTokenRefreshView(TokenRefreshView):
+    throttle_classes = [AuthRateThrottle]
+
     @swagger_auto_schema(
         operation_description="""
         Refresh Token을 입력받아 새로운 JWT Access Token을 발급합니다.
@@ -651,6 +895,7 @@ class LogoutView(APIView):
     """Logout view that blacklists the refresh token"""
 
     permission_classes = (IsAuthenticated,)
+    throttle_classes = [AuthRateThrottle]
 
     def post(self, request):
         try:
@@ -671,11 +916,14 @@ class CreditUsageListView(generics.ListAPIView):
 
     serializer_class = CreditUsageSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreditUsagePagination
 
     def get_queryset(self):
         """사용자의 크레딧 사용 내역 반환"""
-        return CreditUsage.objects.filter(user=self.request.user).order_by(
-            "-created_at"
+        # Ordering comes from the cursor paginator; the projection matches
+        # the serializer so the (user, created_at, id) index covers the scan
+        return CreditUsage.objects.filter(user=self.request.user).only(
+            "id", "amount", "is_usage", "reason", "created_at"
         )
 
     @swagger_auto_schema(
@@ -722,7 +970,23 @@ class CreditInfoView(APIView):
     )
     def get(self, request):
         """사용자의 현재 크레딧 정보 반환"""
-        return Response({"credits": request.user.credits})
+        # Fetch the balance fresh (request.user may come from the auth
+        # cache) and keep it for a few seconds between polls; every
+        # balance change deletes this key
+        user_id = request.user.pk
+        credits = cache.get_or_set(
+            credits_cache_key(user_id),
+            lambda: User.objects.only("credits").get(pk=user_id).credits,
+            CREDITS_CACHE_TIMEOUT,
+        )
+        # Balance polling dominates this endpoint; a matching ETag turns
+        # the response into an empty 304
+        etag = _make_etag(user_id, credits)
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        response = Response({"credits": credits})
+        response["ETag"] = etag
+        return response
 
 
 class CreditChargeView(APIView):